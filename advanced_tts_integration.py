@@ -6,11 +6,27 @@ using various TTS engines.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import asyncio
+import copy
+import hashlib
+import io
+import itertools
 import os
+import shutil
 import logging
+import queue
+import re
+import subprocess
+import threading
 import time
-from typing import Dict, List, Union, Optional, Any
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Union, Optional, Any
 from gtts import gTTS  # Google Text-to-Speech
 import pygame  # For audio playback
 from dotenv import load_dotenv  # For loading environment variables
@@ -28,6 +44,138 @@ except ImportError:
 
 import tempfile
 
+# Prefer piping conversions through the ffmpeg binary when it is on PATH;
+# pydub stays as the fallback converter
+FFMPEG_AVAILABLE = shutil.which("ffmpeg") is not None
+
+# Try to import aiohttp for async HTTP support, falling back to threaded
+# requests if it is not installed
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logging.warning("aiohttp is not available. Async fetches will run blocking requests in a thread.")
+
+# Try to import pysimdjson for lazy JSON navigation; fall back to the stdlib
+# parser when it is not installed
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# Try to import orjson (preferred) or ujson for fast JSON decoding; fall
+# back to the stdlib decoder when neither is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+
+def _json_loads(payload: Union[bytes, bytearray, str]) -> Any:
+    """
+    Decode JSON with orjson when available, then ujson, then stdlib json.
+
+    All three accept bytes directly, so callers can feed response bodies
+    without an intermediate str. This bypasses requests' charset detection
+    and assumes UTF-8, which every JSON API we talk to sends.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError; ujson errors
+    are remapped so callers can keep catching the stdlib exception.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    if UJSON_AVAILABLE:
+        try:
+            return ujson.loads(payload)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+    return json.loads(payload)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode JSON to bytes with orjson when available, stdlib json otherwise."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Node types the text search treats as scalars and as containers. JSON
+# decoding only produces exact dict/list/str/int/float/bool/NoneType
+# values, so the search dispatches on type(node) instead of re-running
+# isinstance ladders (None is deliberately not speakable text)
+_SCALAR_TYPES = frozenset((str, int, float, bool))
+_CONTAINER_TYPES = frozenset((dict, list))
+
+
+def _search_dict_node(node: Dict[str, Any], text_key: str, queue: deque) -> Optional[str]:
+    """Check one dict for text_key; enqueue its container children."""
+    if text_key in node:
+        value = node[text_key]
+        if type(value) in _SCALAR_TYPES:
+            # Empty strings don't end the search; nested containers may
+            # still hold a usable match
+            text = str(value)
+            if text:
+                return text
+        if type(value) is list:
+            # All-string lists (the common shape for API text fields) join
+            # directly, skipping per-element str() dispatch
+            strings = [item for item in value if type(item) is str]
+            if len(strings) == len(value):
+                joined = " ".join(strings)
+            else:
+                # Mixed content: stringify the scalar items only
+                joined = " ".join(map(str, (item for item in value if type(item) in _SCALAR_TYPES)))
+            if joined:
+                return joined
+
+    for value in node.values():
+        if type(value) in _CONTAINER_TYPES:
+            queue.append(value)
+    return None
+
+
+def _search_list_node(node: List[Any], text_key: str, queue: deque) -> Optional[str]:
+    """Enqueue the container items of one list."""
+    for item in node:
+        if type(item) in _CONTAINER_TYPES:
+            queue.append(item)
+    return None
+
+
+# Handler table keyed by exact node type; one dict lookup replaces the
+# per-node isinstance chain
+_NODE_HANDLERS = {
+    dict: _search_dict_node,
+    list: _search_list_node,
+}
+
+# Sentinel distinguishing "path did not resolve" from a legitimate None value
+_PATH_MISS = object()
+
+# Interned once; fetch paths test response Content-Type against this
+_JSON_CONTENT_TYPE = "application/json"
+
+# Matches the whitespace after a sentence terminator, for splitting long
+# texts into independently synthesizable fragments
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# Pre-bound hot-path function: one global load instead of a module +
+# attribute lookup on every synthesis or playback call
+_path_exists = os.path.exists
+
+# Process-wide counter for generated fallback filenames; a second-resolution
+# timestamp collides under concurrent synthesis and overwrites output
+_filename_counter = itertools.count()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +187,89 @@ logging.basicConfig(
 )
 logger = logging.getLogger("AdvancedTTS")
 
+# gTTS opens a fresh `requests.Session()` (a new TCP+TLS handshake) inside
+# every stream() call. Rebinding gtts.tts's requests name to a shim that
+# proxies the real module but hands out one shared, non-closing Session
+# lets repeated synths reuse a pooled connection while keeping the module
+# surface gtts relies on (Request, exceptions, packages) intact. The
+# Gemini SDK already keeps a persistent channel, so it needs no
+# equivalent treatment.
+class _NonClosingSession(requests.Session):
+    """Session whose close() is a no-op, surviving gtts's per-call
+    `with requests.Session() as s:` context manager."""
+
+    def close(self) -> None:
+        pass
+
+
+class _GttsRequestsShim:
+    """Stand-in for the requests module inside gtts.tts: every attribute
+    resolves against the real module, but Session() returns the shared
+    keep-alive session instead of constructing a fresh one."""
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    @staticmethod
+    def Session() -> requests.Session:
+        return _gtts_session
+
+
+_gtts_session = _NonClosingSession()
+try:
+    import gtts.tts as _gtts_module
+    _gtts_module.requests = _GttsRequestsShim()
+    logger.info("Bound gTTS to a persistent keep-alive session")
+except (ImportError, AttributeError) as e:
+    logger.warning(f"Could not install keep-alive session for gTTS: {e}")
+
+# Idle gTTS instances pooled by (lang, slow). Construction validates the
+# language and sets up tokenization on every call; borrowing an instance
+# and swapping its text skips that setup. A list per key (instead of one
+# shared instance) keeps concurrent fragment synthesis safe.
+_gtts_pool: Dict[tuple, list] = {}
+_gtts_pool_lock = threading.Lock()
+
+
+def _borrow_gtts(text: str, lang: str, slow: bool) -> gTTS:
+    """Reuse an idle pooled gTTS instance for this lang/slow pair, or build one."""
+    with _gtts_pool_lock:
+        pool = _gtts_pool.get((lang, slow))
+        if pool:
+            tts = pool.pop()
+            tts.text = text
+            return tts
+    return gTTS(text=text, lang=lang, slow=slow)
+
+
+def _return_gtts(tts: gTTS, lang: str, slow: bool) -> None:
+    """Park a gTTS instance back in the pool for later reuse."""
+    with _gtts_pool_lock:
+        _gtts_pool.setdefault((lang, slow), []).append(tts)
+
+# Shared aiohttp session, created lazily so importing this module never opens
+# sockets. All async fetches reuse the same connection pool.
+_aiohttp_session = None
+
+
+async def _get_aiohttp_session() -> "aiohttp.ClientSession":
+    """Return the shared aiohttp session, creating it on first use."""
+    global _aiohttp_session
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        _aiohttp_session = aiohttp.ClientSession(connector=connector)
+        logger.info("Created shared aiohttp session")
+    return _aiohttp_session
+
+
+async def close_aiohttp_session() -> None:
+    """Close the shared aiohttp session if it was created."""
+    global _aiohttp_session
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+        logger.info("Closed shared aiohttp session")
+    _aiohttp_session = None
+
 
 class AdvancedTTSIntegration:
     """Advanced Text-to-Speech integration with multiple TTS engines and API support."""
@@ -55,6 +286,31 @@ class AdvancedTTSIntegration:
         "wav": "Waveform Audio File Format",
         "ogg": "Ogg Vorbis Audio"
     }
+
+    # Name of the on-disk synthesis cache directory (inside output_dir) and
+    # the limits (entry count and total bytes) past which least-recently-used
+    # entries are evicted
+    SYNTH_CACHE_DIR = ".cache"
+    SYNTH_CACHE_MAX_ENTRIES = 128
+    SYNTH_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+    # How long (seconds) a fetched API response may be served from the
+    # in-memory cache before it is re-fetched
+    RESPONSE_CACHE_TTL = 30.0
+
+    # On-disk response cache (inside output_dir): entry lifetime and the
+    # maximum number of cached responses kept before LRU eviction
+    HTTP_CACHE_DIR = ".http_cache"
+    HTTP_CACHE_TTL = 300.0
+    HTTP_CACHE_MAX_ENTRIES = 64
+
+    # Texts at least this long are split on sentence boundaries and
+    # synthesized as concurrent fragments on a pool this wide
+    CHUNK_MIN_CHARS = 400
+    CHUNK_MAX_WORKERS = 4
+
+    # Sentinel marking the end of a synthesis worker's queues
+    WORKER_DONE = object()
     
     def __init__(self, 
                  api_url: Optional[str] = None, 
@@ -73,7 +329,7 @@ class AdvancedTTSIntegration:
             api_headers: Headers to use for API requests
         """
         self.api_url = api_url
-        self.output_dir = output_dir
+        self.output_dir = Path(output_dir)
         self.api_headers = api_headers or {}
         
         # Validate and set TTS engine
@@ -93,21 +349,214 @@ class AdvancedTTSIntegration:
             self.audio_format = "mp3"
         else:
             self.audio_format = audio_format
-            
+
+        # Pre-computed filename suffix for the selected format
+        self._format_suffix = "." + self.audio_format
+
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        if not self.output_dir.exists():
+            self.output_dir.mkdir(parents=True)
             logger.info(f"Created output directory: {output_dir}")
+
+        # In-process index of already-synthesized texts (hash -> cache file path),
+        # used to skip even the os.path.exists check on repeated calls
+        self._synth_cache: Dict[str, str] = {}
+
+        # Fastest repeat path: (text, lang, slow, engine, format) ->
+        # finished output file, checked before BLAKE2b hashing or disk access
+        self._mem_cache: Dict[tuple, str] = {}
+
+        # Memoized GET responses: cache key -> (fetch time, parsed JSON).
+        # Identical fetches within RESPONSE_CACHE_TTL become dict lookups
+        self._response_cache: Dict[tuple, tuple] = {}
+
+        # Reusable simdjson parser for lazy navigation of raw response bytes
+        self._json_parser = simdjson.Parser() if SIMDJSON_AVAILABLE else None
+
+        # Compiled accessors for dotted text_key paths, built once per
+        # distinct path and reused across pipeline calls
+        self._path_cache: Dict[str, Callable[[Any], Any]] = {}
+
+        # Persistent HTTP session so repeated fetches reuse pooled keep-alive
+        # connections instead of paying a TCP+TLS handshake per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         
         # Initialize pygame mixer for audio playback
+        self._music_end_event = pygame.USEREVENT + 1
         try:
             pygame.mixer.init()
+            # pygame's event queue only runs with the display subsystem
+            # initialized; use the dummy video driver so no window appears
+            # and the end-of-track wait can block on events. If this fails,
+            # _wait_for_playback degrades to its polling path.
+            if not pygame.display.get_init():
+                os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+                try:
+                    pygame.display.init()
+                except pygame.error as e:
+                    logger.warning(f"Could not initialize pygame events, playback waits will poll: {e}")
+            # Have the mixer post an event when a track ends so play_audio
+            # can block instead of polling
+            pygame.mixer.music.set_endevent(self._music_end_event)
             logger.info("Initialized pygame mixer for audio playback")
         except Exception as e:
             logger.error(f"Failed to initialize pygame mixer: {e}")
-    
-    def fetch_data(self, 
-                  api_url: Optional[str] = None, 
+
+    def close(self) -> None:
+        """Close the persistent HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "AdvancedTTSIntegration":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _response_cache_key(method: str,
+                            url: str,
+                            headers: Dict[str, str],
+                            params: Optional[Dict[str, Any]]) -> tuple:
+        """Build the memoization key for a fetch (method, URL, headers, params)."""
+        # requests accepts list-valued params ({"tags": ["a", "b"]});
+        # tuple-ize those so the key stays hashable
+        return (
+            method.upper(),
+            url,
+            tuple(sorted(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in params.items()
+            )) if params else None,
+            tuple(sorted(headers.items()))
+        )
+
+    def _response_cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of a fresh cached response, or None."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+
+        fetched_at, response, raw = entry
+        if time.monotonic() - fetched_at > self.RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return None
+
+        # Entry written by a raw fetch: parse the bytes once and keep both
+        if response is None:
+            try:
+                response = _json_loads(raw)
+            except json.JSONDecodeError:
+                return None
+            self._response_cache[key] = (fetched_at, response, raw)
+
+        logger.info(f"Response cache hit for {key[1]}")
+        # Deep copy so callers can't mutate the cached tree
+        return copy.deepcopy(response)
+
+    def _response_cache_get_raw(self, key: tuple) -> Optional[bytes]:
+        """Return the raw bytes of a fresh cached response, or None."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+
+        fetched_at, response, raw = entry
+        if time.monotonic() - fetched_at > self.RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return None
+
+        # Entry written by a parsed fetch without its body: re-encode once
+        if raw is None:
+            try:
+                raw = _json_dumps(response)
+            except (TypeError, ValueError):
+                return None
+            self._response_cache[key] = (fetched_at, response, raw)
+
+        logger.info(f"Response cache hit for {key[1]}")
+        return raw
+
+    def _response_cache_put(self,
+                            key: tuple,
+                            response: Optional[Dict[str, Any]],
+                            raw: Optional[bytes] = None) -> None:
+        """Store a fetched response (parsed tree and/or raw body) with its timestamp."""
+        self._response_cache[key] = (
+            time.monotonic(),
+            copy.deepcopy(response) if response is not None else None,
+            raw
+        )
+
+    def _http_cache_path(self, key: tuple) -> str:
+        """Return the on-disk cache file path for a fetch cache key."""
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.fspath(self.output_dir / self.HTTP_CACHE_DIR / (digest + ".json"))
+
+    def _http_cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a cached response from disk if present and fresh, else None."""
+        path = self._http_cache_path(key)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.HTTP_CACHE_TTL:
+                return None
+            with open(path, "rb") as cache_file:
+                response = _json_loads(cache_file.read())
+            logger.info(f"Disk cache hit for {key[1]}")
+            return response
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _http_cache_get_raw(self, key: tuple) -> Optional[bytes]:
+        """Return a cached response body from disk if present and fresh, else None."""
+        path = self._http_cache_path(key)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.HTTP_CACHE_TTL:
+                return None
+            with open(path, "rb") as cache_file:
+                raw = cache_file.read()
+            logger.info(f"Disk cache hit for {key[1]}")
+            return raw
+        except OSError:
+            return None
+
+    def _http_cache_put(self, key: tuple, response: Dict[str, Any]) -> None:
+        """Persist a fetched response to the on-disk cache."""
+        try:
+            self._http_cache_put_raw(key, _json_dumps(response))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Could not write response to disk cache: {e}")
+
+    def _http_cache_put_raw(self, key: tuple, raw: bytes) -> None:
+        """Persist a raw response body to the on-disk cache."""
+        path = self._http_cache_path(key)
+        cache_dir = os.path.dirname(path)
+        try:
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            with open(path, "wb") as cache_file:
+                cache_file.write(raw)
+            self._evict_lru(cache_dir, self.HTTP_CACHE_MAX_ENTRIES)
+        except OSError as e:
+            logger.warning(f"Could not write response to disk cache: {e}")
+
+    def clear_cache(self) -> None:
+        """Drop all memoized API responses, in memory and on disk."""
+        self._response_cache.clear()
+
+        cache_dir = self.output_dir / self.HTTP_CACHE_DIR
+        try:
+            for name in os.listdir(cache_dir):
+                os.unlink(os.path.join(cache_dir, name))
+        except OSError:
+            pass
+
+    def fetch_data(self,
+                  api_url: Optional[str] = None,
                   method: str = "GET", 
                   headers: Optional[Dict[str, str]] = None, 
                   params: Optional[Dict[str, Any]] = None,
@@ -133,37 +582,208 @@ class AdvancedTTSIntegration:
         
         # Merge headers with instance headers
         request_headers = {**self.api_headers, **(headers or {})}
-        
+
+        # Serve repeated GETs from the in-memory cache while fresh, then the
+        # on-disk cache (promoting disk hits back into memory)
+        cache_key = self._response_cache_key(method, url, request_headers, params)
+        if method.upper() == "GET":
+            cached = self._response_cache_get(cache_key)
+            if cached is not None:
+                return cached
+            cached = self._http_cache_get(cache_key)
+            if cached is not None:
+                self._response_cache_put(cache_key, cached)
+                return cached
+
         try:
             logger.info(f"Fetching data from {url} using {method} method")
-            
+
             if method.upper() == "GET":
-                response = requests.get(url, headers=request_headers, params=params)
+                response = self._session.get(url, headers=request_headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=request_headers, params=params, json=json_data)
+                response = self._session.post(url, headers=request_headers, params=params, json=json_data)
             else:
                 logger.error(f"Unsupported HTTP method: {method}")
                 raise ValueError(f"Unsupported HTTP method: {method}")
-            
+
             response.raise_for_status()  # Raise exception for HTTP errors
-            
+
             # Check if response is JSON
             content_type = response.headers.get("Content-Type", "")
-            if "application/json" in content_type:
-                return response.json()
-            else:
+            if _JSON_CONTENT_TYPE not in content_type:
                 # Try to parse as JSON anyway, but log a warning
                 logger.warning(f"Response is not JSON (Content-Type: {content_type}). Attempting to parse as JSON anyway.")
-                return response.json()
-                
+
+            # Decode from the raw bytes (orjson when available) instead of
+            # response.json()'s text-decode + stdlib parse
+            parsed = _json_loads(response.content)
+            if method.upper() == "GET":
+                self._response_cache_put(cache_key, parsed, raw=response.content)
+                self._http_cache_put_raw(cache_key, response.content)
+            return parsed
+
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching data from API: {e}")
             return None
         except json.JSONDecodeError:
             logger.error("Failed to decode response as JSON")
             return None
-    
-    def extract_text(self, 
+
+    def fetch_raw(self,
+                 api_url: Optional[str] = None,
+                 method: str = "GET",
+                 headers: Optional[Dict[str, str]] = None,
+                 params: Optional[Dict[str, Any]] = None,
+                 json_data: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """
+        Fetch the raw response body without parsing it.
+
+        Combined with extract_text's lazy dotted-path navigation this avoids
+        materializing the whole JSON tree when only one field is needed.
+
+        Args:
+            api_url: URL to fetch data from (overrides instance variable if provided)
+            method: HTTP method to use (GET, POST, etc.)
+            headers: HTTP headers to send with the request
+            params: Query parameters to include in the request
+            json_data: JSON data to include in the request body (for POST requests)
+
+        Returns:
+            bytes: Raw response body or None if the request failed
+        """
+        url = api_url or self.api_url
+
+        if not url:
+            logger.error("API URL must be provided")
+            raise ValueError("API URL must be provided")
+
+        # Merge headers with instance headers
+        request_headers = {**self.api_headers, **(headers or {})}
+
+        # Raw fetches share the response caches with fetch_data: repeated
+        # GETs are served from memory or disk regardless of which path
+        # (parsed or raw) fetched them first
+        cache_key = self._response_cache_key(method, url, request_headers, params)
+        if method.upper() == "GET":
+            cached = self._response_cache_get_raw(cache_key)
+            if cached is not None:
+                return cached
+            cached = self._http_cache_get_raw(cache_key)
+            if cached is not None:
+                self._response_cache_put(cache_key, None, raw=cached)
+                return cached
+
+        try:
+            logger.info(f"Fetching raw data from {url} using {method} method")
+
+            if method.upper() == "GET":
+                response = self._session.get(url, headers=request_headers, params=params)
+            elif method.upper() == "POST":
+                response = self._session.post(url, headers=request_headers, params=params, json=json_data)
+            else:
+                logger.error(f"Unsupported HTTP method: {method}")
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            response.raise_for_status()  # Raise exception for HTTP errors
+
+            content_type = response.headers.get("Content-Type", "")
+            if _JSON_CONTENT_TYPE not in content_type:
+                logger.warning(f"Response is not JSON (Content-Type: {content_type}). Attempting to parse as JSON anyway.")
+
+            if method.upper() == "GET":
+                self._response_cache_put(cache_key, None, raw=response.content)
+                self._http_cache_put_raw(cache_key, response.content)
+            return response.content
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching data from API: {e}")
+            return None
+
+    async def fetch_data_async(self,
+                              api_url: Optional[str] = None,
+                              method: str = "GET",
+                              headers: Optional[Dict[str, str]] = None,
+                              params: Optional[Dict[str, Any]] = None,
+                              json_data: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of fetch_data using the shared aiohttp session.
+
+        Concurrent calls overlap their network waits and reuse pooled
+        connections. Falls back to running the blocking fetch_data in a
+        thread when aiohttp is not installed.
+
+        Args:
+            api_url: URL to fetch data from (overrides instance variable if provided)
+            method: HTTP method to use (GET, POST, etc.)
+            headers: HTTP headers to send with the request
+            params: Query parameters to include in the request
+            json_data: JSON data to include in the request body (for POST requests)
+
+        Returns:
+            dict: JSON response from the API or None if request failed
+        """
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(
+                self.fetch_data, api_url, method, headers, params, json_data
+            )
+
+        url = api_url or self.api_url
+
+        if not url:
+            logger.error("API URL must be provided")
+            raise ValueError("API URL must be provided")
+
+        if method.upper() not in ("GET", "POST"):
+            logger.error(f"Unsupported HTTP method: {method}")
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        # Merge headers with instance headers
+        request_headers = {**self.api_headers, **(headers or {})}
+
+        # Serve repeated GETs from the in-memory cache while fresh, then the
+        # on-disk cache (promoting disk hits back into memory)
+        cache_key = self._response_cache_key(method, url, request_headers, params)
+        if method.upper() == "GET":
+            cached = self._response_cache_get(cache_key)
+            if cached is not None:
+                return cached
+            cached = self._http_cache_get(cache_key)
+            if cached is not None:
+                self._response_cache_put(cache_key, cached)
+                return cached
+
+        try:
+            logger.info(f"Fetching data from {url} using {method} method (async)")
+
+            session = await _get_aiohttp_session()
+            async with session.request(method.upper(), url,
+                                       headers=request_headers,
+                                       params=params,
+                                       json=json_data) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get("Content-Type", "")
+                if _JSON_CONTENT_TYPE not in content_type:
+                    logger.warning(f"Response is not JSON (Content-Type: {content_type}). Attempting to parse as JSON anyway.")
+
+                # Read raw bytes and decode them ourselves so the fast
+                # decoders skip aiohttp's text decode and content-type check
+                payload = await response.read()
+                parsed = _json_loads(payload)
+                if method.upper() == "GET":
+                    self._response_cache_put(cache_key, parsed, raw=payload)
+                    self._http_cache_put_raw(cache_key, payload)
+                return parsed
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Error fetching data from API: {e}")
+            return None
+        except json.JSONDecodeError:
+            logger.error("Failed to decode response as JSON")
+            return None
+
+    def extract_text(self,
                     data: Union[Dict[str, Any], List[Any]], 
                     text_key: str = 'text',
                     max_length: Optional[int] = None) -> str:
@@ -181,158 +801,714 @@ class AdvancedTTSIntegration:
         if not data:
             logger.warning("No data provided for text extraction")
             return ""
-        
+
+        # Raw response bytes: navigate lazily (or parse and fall through)
+        if isinstance(data, (bytes, bytearray)):
+            return self._extract_from_raw(data, text_key, max_length)
+
         extracted_text = ""
-        
+
         # Handle direct access via dot notation (e.g., "data.articles.0.title")
         if "." in text_key:
-            parts = text_key.split(".")
-            current = data
             try:
-                for part in parts:
-                    if isinstance(current, list) and part.isdigit():
-                        current = current[int(part)]
-                    elif isinstance(current, dict) and part in current:
-                        current = current[part]
-                    else:
-                        logger.warning(f"Could not navigate to {part} in {text_key}")
-                        return ""
-                
-                if isinstance(current, (str, int, float)):
-                    extracted_text = str(current)
-                else:
-                    logger.warning(f"Final value for {text_key} is not a string: {type(current)}")
-                    return ""
-            except (IndexError, KeyError) as e:
-                logger.warning(f"Error navigating path {text_key}: {e}")
+                current = self._path_accessor(text_key)(data)
+            except (KeyError, IndexError, TypeError):
+                # Unusual shape (e.g. a dict keyed by numeric strings):
+                # retry with the interpreted walker before giving up
+                current = self._walk_dotted_path(data, text_key)
+
+            if current is _PATH_MISS:
                 return ""
-                
-        # Handle different data structures
+            if isinstance(current, (str, int, float)):
+                extracted_text = str(current)
+            else:
+                logger.warning(f"Final value for {text_key} is not a string: {type(current)}")
+                return ""
+
+        # Search nested dictionaries iteratively for the key
         elif isinstance(data, dict):
-            # If text_key exists in the data, return its value
-            if text_key in data:
-                if isinstance(data[text_key], (str, int, float)):
-                    extracted_text = str(data[text_key])
-                elif isinstance(data[text_key], list):
-                    # Join list items if they're strings
-                    extracted_text = " ".join(str(item) for item in data[text_key] if isinstance(item, (str, int, float)))
-            
-            # Recursive search in nested dictionaries if no text found yet
-            if not extracted_text:
-                for key, value in data.items():
-                    if isinstance(value, (dict, list)):
-                        result = self.extract_text(value, text_key)
-                        if result:
-                            extracted_text = result
-                            break
-        
+            extracted_text = self._search_text(data, text_key)
+
         # Handle list type data
         elif isinstance(data, list):
-            # Concatenate all text items in the list
+            # Collect flat fragments and join exactly once at the end; when a
+            # max_length is set, stop extracting as soon as enough text has
+            # accumulated instead of building the full string and trimming
             all_text = []
+            total_length = 0
             for item in data:
                 if isinstance(item, (dict, list)):
-                    extracted = self.extract_text(item, text_key)
-                    if extracted:
-                        all_text.append(extracted)
+                    fragment = self._search_text(item, text_key)
                 elif isinstance(item, (str, int, float)) and text_key == "":
                     # If text_key is empty, collect all string items
-                    all_text.append(str(item))
-            
+                    fragment = str(item)
+                else:
+                    continue
+
+                if fragment:
+                    all_text.append(fragment)
+                    total_length += len(fragment) + 1  # +1 for the join separator
+                    if max_length and total_length >= max_length:
+                        break
+
             extracted_text = " ".join(all_text)
-        
+
         # Apply maximum length if specified
         if max_length and len(extracted_text) > max_length:
             logger.info(f"Trimming extracted text to {max_length} characters")
             extracted_text = extracted_text[:max_length]
         
         return extracted_text
-    
-    def text_to_speech(self, 
-                      text: str, 
-                      filename: Optional[str] = None, 
+
+    def _path_accessor(self, text_key: str) -> Callable[[Any], Any]:
+        """
+        Return a specialized accessor for a dotted path, compiling it on
+        first sighting.
+
+        The generated function hardcodes the subscript chain — e.g.
+        "data.0.short_description" compiles to
+        data["data"][0]["short_description"] — so repeated pipeline calls
+        skip the interpreted part-by-part walk entirely.
+
+        Args:
+            text_key: Dotted path such as "data.0.title"
+
+        Returns:
+            Callable: Function mapping a decoded payload to the path's value
+        """
+        accessor = self._path_cache.get(text_key)
+        if accessor is None:
+            subscripts = "".join(
+                f"[{int(part)}]" if part.isdigit() else f"[{part!r}]"
+                for part in text_key.split(".")
+            )
+            source = f"def _accessor(data):\n    return data{subscripts}\n"
+            namespace: Dict[str, Any] = {}
+            exec(compile(source, f"<path {text_key}>", "exec"), namespace)
+            accessor = namespace["_accessor"]
+            self._path_cache[text_key] = accessor
+        return accessor
+
+    @staticmethod
+    def _walk_dotted_path(data: Union[Dict[str, Any], List[Any]], text_key: str) -> Any:
+        """
+        Interpreted fallback walker for dotted paths.
+
+        Handles shapes the compiled accessor cannot, such as dicts keyed by
+        numeric strings. Returns _PATH_MISS when the path does not resolve.
+        """
+        current = data
+        try:
+            for part in text_key.split("."):
+                if isinstance(current, list) and part.isdigit():
+                    current = current[int(part)]
+                elif isinstance(current, dict) and part in current:
+                    current = current[part]
+                else:
+                    logger.warning(f"Could not navigate to {part} in {text_key}")
+                    return _PATH_MISS
+        except (IndexError, KeyError) as e:
+            logger.warning(f"Error navigating path {text_key}: {e}")
+            return _PATH_MISS
+
+        return current
+
+    def _extract_from_raw(self,
+                         buf: Union[bytes, bytearray],
+                         text_key: str,
+                         max_length: Optional[int] = None) -> str:
+        """
+        Extract text from un-parsed JSON bytes.
+
+        For dotted keys with simdjson available, the document is navigated
+        with a JSON pointer so only the nodes along the path are
+        materialized; everything else in the payload stays undecoded.
+        Without simdjson (or for non-dotted keys) the bytes are parsed once
+        and handed to the regular extractor.
+
+        Args:
+            buf: Raw JSON response bytes
+            text_key: Key to extract text from
+            max_length: Maximum length of text to extract (None for no limit)
+
+        Returns:
+            str: Extracted text
+        """
+        if "." in text_key and self._json_parser is not None:
+            try:
+                document = self._json_parser.parse(buf)
+                value = document.at_pointer("/" + text_key.replace(".", "/"))
+                if isinstance(value, (str, int, float)):
+                    extracted_text = str(value)
+                    if max_length and len(extracted_text) > max_length:
+                        logger.info(f"Trimming extracted text to {max_length} characters")
+                        extracted_text = extracted_text[:max_length]
+                    return extracted_text
+                logger.warning(f"Final value for {text_key} is not a string: {type(value)}")
+                return ""
+            except (KeyError, IndexError, ValueError) as e:
+                logger.warning(f"Error navigating path {text_key}: {e}")
+                return ""
+
+        # No lazy parser (or a generic key): decode once and reuse the
+        # regular extraction logic
+        try:
+            parsed = _json_loads(buf)
+        except json.JSONDecodeError:
+            logger.error("Failed to decode raw response as JSON")
+            return ""
+
+        return self.extract_text(parsed, text_key, max_length)
+
+    @staticmethod
+    def _search_text(data: Union[Dict[str, Any], List[Any]], text_key: str) -> str:
+        """
+        Breadth-first search for text_key in a nested structure.
+
+        An explicit deque replaces the old recursive walk: each node is
+        visited at most once, there is no per-node call-frame overhead, and
+        the search stops at the first (shallowest) scalar match.
+
+        Args:
+            data: Nested dict/list structure to search
+            text_key: Key whose value should be extracted
+
+        Returns:
+            str: The first matching text found, or an empty string
+        """
+        queue = deque([data])
+
+        while queue:
+            node = queue.popleft()
+            handler = _NODE_HANDLERS.get(type(node))
+            if handler is None:
+                continue
+
+            result = handler(node, text_key, queue)
+            if result is not None:
+                return result
+
+        return ""
+
+    def _synth_cache_key(self, text: str, lang: str, slow: bool) -> str:
+        """
+        Compute the content-addressable cache key for a synthesis request.
+
+        Args:
+            text: Text to convert to speech
+            lang: Language code
+            slow: Whether to speak slowly
+
+        Returns:
+            str: Hex digest uniquely identifying the synthesized audio
+        """
+        key_material = f"{self.tts_engine}|{lang}|{slow}|{self.audio_format}|{text}"
+        return hashlib.blake2b(key_material.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _synth_cache_path(self, key: str) -> str:
+        """Return the on-disk cache file path for a given cache key."""
+        return os.fspath(self.output_dir / self.SYNTH_CACHE_DIR / (key + self._format_suffix))
+
+    @staticmethod
+    def _link_or_copy(src: str, dst: str) -> None:
+        """Hardlink src to dst, falling back to a copy if linking fails."""
+        if os.path.exists(dst):
+            os.unlink(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    @staticmethod
+    def _evict_lru(cache_dir: Union[str, Path],
+                   max_entries: int,
+                   max_bytes: Optional[int] = None) -> None:
+        """
+        Evict least-recently-used files in cache_dir until the directory is
+        back under max_entries files and (when given) max_bytes total size.
+        """
+        try:
+            entries = []
+            total_bytes = 0
+            for name in os.listdir(cache_dir):
+                path = os.path.join(cache_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_atime, stat.st_size, path))
+                total_bytes += stat.st_size
+        except OSError:
+            return
+
+        # Oldest access time first; remove until we're back under the limits
+        entries.sort()
+        remaining = len(entries)
+        for atime, size, path in entries:
+            if remaining <= max_entries and (max_bytes is None or total_bytes <= max_bytes):
+                break
+            try:
+                os.unlink(path)
+                remaining -= 1
+                total_bytes -= size
+                logger.info(f"Evicted cache entry: {path}")
+            except OSError as e:
+                logger.warning(f"Could not evict cache entry {path}: {e}")
+
+    def _evict_synth_cache(self) -> None:
+        """Evict least-recently-used synthesis cache entries beyond the limits."""
+        self._evict_lru(self.output_dir / self.SYNTH_CACHE_DIR,
+                        self.SYNTH_CACHE_MAX_ENTRIES,
+                        self.SYNTH_CACHE_MAX_BYTES)
+
+    def _store_in_synth_cache(self, key: str, audio_path: str) -> None:
+        """
+        Move a freshly synthesized file into the cache and hardlink it back
+        to its original location.
+        """
+        cache_path = self._synth_cache_path(key)
+        cache_dir = os.path.dirname(cache_path)
+
+        try:
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+
+            # Atomic within output_dir: cache dir and output share a filesystem
+            os.replace(audio_path, cache_path)
+            self._link_or_copy(cache_path, audio_path)
+            self._synth_cache[key] = cache_path
+            self._evict_synth_cache()
+        except OSError as e:
+            logger.warning(f"Could not cache synthesized audio: {e}")
+
+    def _synthesize_chunked(self,
+                            text: str,
+                            output_path: str,
+                            lang: str,
+                            slow: bool) -> bool:
+        """
+        Synthesize a long text as concurrent sentence fragments.
+
+        gTTS latency grows with text length, so texts of CHUNK_MIN_CHARS or
+        more are split on sentence boundaries, each fragment is synthesized
+        on its own thread, and the raw mp3 segments are joined in input
+        order (gTTS mp3 output concatenates safely).
+
+        Args:
+            text: Text to convert to speech
+            output_path: Destination mp3 file
+            lang: Language code
+            slow: Whether to speak slowly
+
+        Returns:
+            bool: True if the chunked path produced the file, False when
+                the text is too short or contains a single sentence
+        """
+        if len(text) < self.CHUNK_MIN_CHARS:
+            return False
+
+        sentences = [s for s in _SENTENCE_END.split(text) if s.strip()]
+        if len(sentences) < 2:
+            return False
+
+        def synth_fragment(fragment: str) -> bytes:
+            buf = io.BytesIO()
+            tts = _borrow_gtts(fragment, lang, slow)
+            tts.write_to_fp(buf)
+            _return_gtts(tts, lang, slow)
+            return buf.getvalue()
+
+        logger.info(f"Synthesizing {len(sentences)} sentence fragments concurrently")
+        with ThreadPoolExecutor(max_workers=self.CHUNK_MAX_WORKERS) as executor:
+            segments = list(executor.map(synth_fragment, sentences))
+
+        with open(output_path, "wb") as out:
+            for segment in segments:
+                out.write(segment)
+        return True
+
+    def _synthesize_to_memory(self,
+                              text: str,
+                              lang: str,
+                              slow: bool) -> Optional[bytes]:
+        """
+        Synthesize straight into memory, returning mp3 bytes.
+
+        Skips the disk round-trip entirely for callers that play the
+        result immediately; the content-addressable cache is still
+        consulted so repeated texts cost a single read.
+
+        Args:
+            text: Text to convert to speech
+            lang: Language code
+            slow: Whether to speak slowly
+
+        Returns:
+            bytes: mp3 audio data or None if synthesis failed
+        """
+        try:
+            # Serve cached audio when this text was synthesized before
+            # (cache keys include the format, so only valid for mp3 output)
+            if self.audio_format == "mp3":
+                cache_key = self._synth_cache_key(text, lang, slow)
+                cached_path = self._synth_cache.get(cache_key) or self._synth_cache_path(cache_key)
+                if _path_exists(cached_path):
+                    logger.info(f"Cache hit for text (key {cache_key[:12]}...), reusing cached audio")
+                    with open(cached_path, "rb") as cached:
+                        return cached.read()
+
+            buf = io.BytesIO()
+            tts = _borrow_gtts(text, lang, slow)
+            tts.write_to_fp(buf)
+            _return_gtts(tts, lang, slow)
+            return buf.getvalue()
+        except Exception as e:
+            logger.error(f"Error converting text to speech in memory: {e}")
+            return None
+
+    def text_to_speech(self,
+                      text: str,
+                      filename: Optional[str] = None,
                       lang: str = 'en',
-                      slow: bool = False) -> Optional[str]:
+                      slow: bool = False,
+                      in_memory: bool = False) -> Union[str, bytes, None]:
         """
         Convert text to speech using the selected TTS engine.
-        
+
         Args:
             text: Text to convert to speech
             filename: Output filename (without extension)
             lang: Language code
             slow: Whether to speak slowly
-            
+            in_memory: Return the mp3 bytes instead of writing a file,
+                for callers that play or transmit the audio immediately
+
         Returns:
-            str: Path to the saved audio file or None if conversion failed
+            str: Path to the saved audio file (or the audio bytes when
+                in_memory is set), None if conversion failed
         """
         if not text:
             logger.warning("No text provided for conversion")
             return None
-        
-        # Generate filename if not provided
+
+        # gTTS blocks on HTTP; nudge async callers toward the threaded
+        # wrapper before they stall their event loop
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            warnings.warn(
+                "text_to_speech blocks the event loop; use text_to_speech_async "
+                "from async code", RuntimeWarning, stacklevel=2)
+
+        # In-memory mode: hand back mp3 bytes, no file or fsync involved
+        if in_memory:
+            return self._synthesize_to_memory(text, lang, slow)
+
+        # Keyed on the text itself: dict equality rules out the collisions
+        # a bare hash() key would admit
+        mem_key = (text, lang, slow, self.tts_engine, self.audio_format)
+
+        # Generate filename if not provided; counter + time_ns stays unique
+        # under the concurrent batch and worker paths
         if not filename:
-            timestamp = int(time.time())
-            filename = f"tts_output_{timestamp}"
-        
-        # Add extension if not present
-        if not filename.endswith(f'.{self.audio_format}'):
-            filename += f'.{self.audio_format}'
-        
-        output_path = os.path.join(self.output_dir, filename)
-        
+            filename = f"tts_output_{next(_filename_counter)}_{time.time_ns()}"
+
+        # Add extension if not present (suffix precomputed in __init__)
+        if not filename.endswith(self._format_suffix):
+            filename += self._format_suffix
+
+        output_path = os.fspath(self.output_dir / filename)
+
+        # Same text and settings already synthesized in this process: reuse
+        # the finished file, still delivering it at the caller's requested
+        # path rather than wherever the first synthesis landed
+        hit = self._mem_cache.get(mem_key)
+        if hit and _path_exists(hit):
+            logger.info(f"Reusing audio already synthesized this run: {hit}")
+            if hit == output_path:
+                return hit
+            try:
+                self._link_or_copy(hit, output_path)
+                return output_path
+            except OSError as e:
+                logger.warning(f"Could not reuse synthesized audio, re-synthesizing: {e}")
+
+        # Check the content-addressable cache before paying for synthesis.
+        # Identical text/engine/language/format combinations map to the same
+        # cached file, so repeats cost a hardlink instead of an HTTP round-trip.
+        cache_key = self._synth_cache_key(text, lang, slow)
+        cached_path = self._synth_cache.get(cache_key) or self._synth_cache_path(cache_key)
+        if _path_exists(cached_path):
+            logger.info(f"Cache hit for text (key {cache_key[:12]}...), reusing cached audio")
+            try:
+                self._link_or_copy(cached_path, output_path)
+                self._synth_cache[cache_key] = cached_path
+                self._mem_cache[mem_key] = output_path
+                return output_path
+            except OSError as e:
+                logger.warning(f"Could not reuse cached audio, re-synthesizing: {e}")
+
         try:
             if self.tts_engine == "gtts":
                 logger.info(f"Using Google TTS to convert text to speech ({lang})")
                 
-                # If format is not mp3 and pydub is not available, fall back to mp3
-                if self.audio_format != "mp3" and not PYDUB_AVAILABLE:
-                    logger.warning(f"Cannot convert to {self.audio_format} without pydub. Falling back to mp3.")
+                # If format is not mp3 and no converter is available, fall back to mp3
+                if self.audio_format != "mp3" and not FFMPEG_AVAILABLE and not PYDUB_AVAILABLE:
+                    logger.warning(f"Cannot convert to {self.audio_format} without ffmpeg or pydub. Falling back to mp3.")
                     original_path = os.path.splitext(output_path)[0] + ".mp3"
-                    tts = gTTS(text=text, lang=lang, slow=slow)
+                    tts = _borrow_gtts(text, lang, slow)
                     tts.save(original_path)
+                    _return_gtts(tts, lang, slow)
                     return original_path
-                
-                # First create MP3 (gTTS only supports MP3)
-                tts = gTTS(text=text, lang=lang, slow=slow)
-                
+
                 if self.audio_format == "mp3":
-                    tts.save(output_path)
-                elif PYDUB_AVAILABLE:
-                    # For other formats, save to a temporary MP3 file and convert
-                    with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-                        temp_path = tmp_file.name
-                        
-                    tts.save(temp_path)
-                    
-                    # Convert to the desired format
-                    audio = AudioSegment.from_mp3(temp_path)
-                    audio.export(output_path, format=self.audio_format)
-                    
-                    # Remove temporary file
-                    os.unlink(temp_path)
+                    # Long texts: synthesize sentence fragments concurrently
+                    # and join the raw mp3 segments, which is safe for gTTS
+                    # output; short texts go out as a single request
+                    if not self._synthesize_chunked(text, output_path, lang, slow):
+                        # Buffer in memory and write once, instead of the
+                        # chunked writes tts.save() would issue
+                        buf = io.BytesIO()
+                        tts = _borrow_gtts(text, lang, slow)
+                        tts.write_to_fp(buf)
+                        _return_gtts(tts, lang, slow)
+                        Path(output_path).write_bytes(buf.getvalue())
+                else:
+                    # First create MP3 (gTTS only supports MP3)
+                    tts = _borrow_gtts(text, lang, slow)
+
+                    # Pipe the MP3 bytes straight into ffmpeg when possible;
+                    # it transcodes without materializing PCM in Python
+                    converted = FFMPEG_AVAILABLE and self._convert_via_ffmpeg(tts, output_path)
+
+                    if not converted and PYDUB_AVAILABLE:
+                        # pydub fallback: stream the MP3 bytes through memory
+                        # instead of a temporary file round-trip
+                        buf = io.BytesIO()
+                        tts.write_to_fp(buf)
+                        buf.seek(0)
+
+                        # Convert to the desired format
+                        audio = AudioSegment.from_file(buf, format="mp3")
+                        audio.export(output_path, format=self.audio_format)
+                    elif not converted:
+                        logger.warning(f"ffmpeg conversion failed and pydub is unavailable. Falling back to mp3.")
+                        original_path = os.path.splitext(output_path)[0] + ".mp3"
+                        tts.save(original_path)
+                        _return_gtts(tts, lang, slow)
+                        return original_path
+
+                    _return_gtts(tts, lang, slow)
             
             else:
                 logger.error(f"TTS engine '{self.tts_engine}' not implemented")
                 return None
-                
+
             logger.info(f"Text converted to speech and saved as '{output_path}'")
+            self._store_in_synth_cache(cache_key, output_path)
+            self._mem_cache[mem_key] = output_path
             return output_path
             
         except Exception as e:
             logger.error(f"Error converting text to speech: {e}")
             return None
-    
-    def play_audio(self, audio_file: str) -> bool:
+
+    async def text_to_speech_async(self,
+                                  text: str,
+                                  filename: Optional[str] = None,
+                                  lang: str = 'en',
+                                  slow: bool = False) -> Optional[str]:
         """
-        Play the audio file.
-        
+        Async wrapper around text_to_speech.
+
+        The blocking gTTS HTTP call runs in a worker thread, keeping the
+        caller's event loop free.
+
         Args:
-            audio_file: Path to the audio file
-            
+            text: Text to convert to speech
+            filename: Output filename (without extension)
+            lang: Language code
+            slow: Whether to speak slowly
+
+        Returns:
+            str: Path to the saved audio file or None if conversion failed
+        """
+        return await asyncio.to_thread(self.text_to_speech, text, filename, lang, slow)
+
+    def start_worker(self, max_workers: Optional[int] = None) -> tuple:
+        """
+        Start a background synthesis worker.
+
+        The worker consumes (text, filename, lang, slow) tuples from the
+        returned input queue, fans the synthesis calls out over a small
+        thread pool, and pushes finished audio paths (or None on failure)
+        onto the returned output queue in input order — the caller plays
+        clip N while later clips are still being synthesized concurrently.
+        Put WORKER_DONE on the input queue to stop the worker; it echoes
+        WORKER_DONE on the output queue once all pending work has drained.
+
+        Args:
+            max_workers: Concurrent synthesis calls (default CHUNK_MAX_WORKERS)
+
+        Returns:
+            tuple: (input queue, output queue)
+        """
+        input_queue: queue.Queue = queue.Queue()
+        output_queue: queue.Queue = queue.Queue()
+        future_queue: queue.Queue = queue.Queue()
+        executor = ThreadPoolExecutor(max_workers=max_workers or self.CHUNK_MAX_WORKERS)
+
+        def _dispatch():
+            while True:
+                item = input_queue.get()
+                try:
+                    if item is self.WORKER_DONE:
+                        future_queue.put(self.WORKER_DONE)
+                        break
+
+                    text, filename, lang, slow = item
+                    future_queue.put(executor.submit(
+                        self.text_to_speech, text, filename, lang, slow))
+                finally:
+                    input_queue.task_done()
+
+        def _emit():
+            # Futures arrive in submission order, so blocking on the oldest
+            # one keeps the output FIFO while the pool works ahead
+            while True:
+                future = future_queue.get()
+                if future is self.WORKER_DONE:
+                    output_queue.put(self.WORKER_DONE)
+                    break
+                try:
+                    output_queue.put(future.result())
+                except Exception as e:
+                    logger.error(f"Worker synthesis failed: {e}")
+                    output_queue.put(None)
+            executor.shutdown()
+
+        threading.Thread(target=_dispatch, name="tts-synth-dispatch", daemon=True).start()
+        threading.Thread(target=_emit, name="tts-synth-emit", daemon=True).start()
+        logger.info("Started background synthesis worker")
+
+        return input_queue, output_queue
+
+    def _wait_for_playback(self) -> None:
+        """
+        Block until the current mixer track finishes.
+
+        Waits on the mixer's end-of-track event rather than polling
+        get_busy() at 10Hz; falls back to a low-rate poll with a single
+        reused Clock when the event subsystem is unavailable (e.g. headless
+        SDL builds).
+        """
+        try:
+            while pygame.mixer.music.get_busy():
+                event = pygame.event.wait(250)
+                if event.type == self._music_end_event:
+                    break
+        except pygame.error:
+            clock = pygame.time.Clock()
+            while pygame.mixer.music.get_busy():
+                clock.tick(10)
+
+    def stream_speech(self,
+                     text: str,
+                     lang: str = 'en',
+                     slow: bool = False) -> bool:
+        """
+        Synthesize text and play it straight from memory, skipping disk.
+
+        The gTTS MP3 bytes are written into a BytesIO buffer and handed
+        directly to the pygame mixer, avoiding the write-then-reload cycle
+        of text_to_speech + play_audio. Use this for ephemeral audio where
+        no file artifact is wanted.
+
+        Args:
+            text: Text to convert to speech
+            lang: Language code
+            slow: Whether to speak slowly
+
+        Returns:
+            bool: True if the audio played successfully, False otherwise
+        """
+        if not text:
+            logger.warning("No text provided for conversion")
+            return False
+
+        try:
+            logger.info(f"Streaming speech from memory ({lang})")
+            buf = io.BytesIO()
+            tts = _borrow_gtts(text, lang, slow)
+            tts.write_to_fp(buf)
+            _return_gtts(tts, lang, slow)
+            buf.seek(0)
+
+            pygame.mixer.music.load(buf)
+            pygame.mixer.music.play()
+            self._wait_for_playback()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error streaming speech: {e}")
+            return False
+
+    def _convert_via_ffmpeg(self, tts: gTTS, output_path: str) -> bool:
+        """
+        Pipe gTTS MP3 bytes through an ffmpeg subprocess to the target format.
+
+        ffmpeg reads from stdin and writes output_path directly, so the PCM
+        intermediate never exists in Python. Returns False on any failure so
+        the caller can fall back to pydub.
+
+        Args:
+            tts: Prepared gTTS object to stream
+            output_path: Destination file in the desired format
+
+        Returns:
+            bool: True if the conversion succeeded
+        """
+        try:
+            proc = subprocess.Popen(
+                ["ffmpeg", "-loglevel", "error", "-y", "-i", "pipe:0",
+                 "-f", self.audio_format, output_path],
+                stdin=subprocess.PIPE
+            )
+            tts.write_to_fp(proc.stdin)
+            proc.stdin.close()
+            if proc.wait() != 0:
+                logger.warning(f"ffmpeg exited with status {proc.returncode}")
+                return False
+            return True
+        except (OSError, ValueError) as e:
+            logger.warning(f"ffmpeg conversion failed: {e}")
+            return False
+
+    def play_audio(self, audio_file: Union[str, bytes, io.BytesIO]) -> bool:
+        """
+        Play an audio file or an in-memory mp3 buffer.
+
+        Args:
+            audio_file: Path to the audio file, or mp3 bytes / BytesIO as
+                returned by text_to_speech(in_memory=True)
+
         Returns:
             bool: True if audio played successfully, False otherwise
         """
-        if not os.path.exists(audio_file):
+        # In-memory audio goes straight into the mixer, no disk involved
+        if isinstance(audio_file, (bytes, io.BytesIO)):
+            if isinstance(audio_file, bytes):
+                audio_file = io.BytesIO(audio_file)
+            try:
+                logger.info("Playing audio from memory")
+                pygame.mixer.music.load(audio_file)
+                pygame.mixer.music.play()
+                self._wait_for_playback()
+                return True
+            except Exception as e:
+                logger.error(f"Error playing in-memory audio: {e}")
+                return False
+
+        if not _path_exists(audio_file):
             logger.error(f"Audio file not found: {audio_file}")
             return False
         
@@ -359,9 +1535,9 @@ class AdvancedTTSIntegration:
             pygame.mixer.music.play()
             
             # Wait for audio to finish playing
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
-                
+            self._wait_for_playback()
+
+
             # Remove temporary file if created
             if temp_file_created:
                 os.unlink(audio_file)
@@ -383,10 +1559,11 @@ class AdvancedTTSIntegration:
                         lang: str = 'en',
                         slow: bool = False,
                         max_length: Optional[int] = None,
-                        auto_play: bool = True) -> Optional[str]:
+                        auto_play: bool = True,
+                        play_only: bool = False) -> Optional[str]:
         """
         Run the complete pipeline: fetch data, extract text, convert to speech, and play.
-        
+
         Args:
             api_url: API URL to fetch data from
             method: HTTP method to use
@@ -399,19 +1576,33 @@ class AdvancedTTSIntegration:
             slow: Whether to speak slowly
             max_length: Maximum length of text to process
             auto_play: Whether to automatically play the audio
-            
+            play_only: Stream the audio straight from memory without writing
+                a file (ignored when output_filename is provided); the
+                pipeline then returns None since no file is produced
+
         Returns:
             str: Path to the generated audio file or None if pipeline failed
         """
-        # Fetch data from API
-        data = self.fetch_data(
-            api_url=api_url, 
-            method=method, 
-            headers=headers, 
-            params=params, 
-            json_data=json_data
-        )
-        
+        # Fetch data from API. For dotted keys with simdjson available we
+        # fetch raw bytes and let extract_text navigate lazily instead of
+        # materializing the whole payload
+        if "." in text_key and self._json_parser is not None:
+            data = self.fetch_raw(
+                api_url=api_url,
+                method=method,
+                headers=headers,
+                params=params,
+                json_data=json_data
+            )
+        else:
+            data = self.fetch_data(
+                api_url=api_url,
+                method=method,
+                headers=headers,
+                params=params,
+                json_data=json_data
+            )
+
         if not data:
             logger.error("No data fetched from API")
             return None
@@ -424,7 +1615,12 @@ class AdvancedTTSIntegration:
             return None
         
         logger.info(f"Extracted text: {text[:100]}..." if len(text) > 100 else f"Extracted text: {text}")
-        
+
+        # Ephemeral playback: stream from memory and skip the disk round-trip
+        if play_only and not output_filename:
+            self.stream_speech(text, lang=lang, slow=slow)
+            return None
+
         # Convert text to speech
         audio_file = self.text_to_speech(
             text=text, 
@@ -433,10 +1629,75 @@ class AdvancedTTSIntegration:
             slow=slow
         )
         
-        if audio_file and os.path.exists(audio_file) and auto_play:
+        if audio_file and _path_exists(audio_file) and auto_play:
             # Play the audio
             self.play_audio(audio_file)
-        
+
+        return audio_file
+
+    async def process_pipeline_async(self,
+                                    api_url: Optional[str] = None,
+                                    method: str = "GET",
+                                    headers: Optional[Dict[str, str]] = None,
+                                    params: Optional[Dict[str, Any]] = None,
+                                    json_data: Optional[Dict[str, Any]] = None,
+                                    text_key: str = 'text',
+                                    output_filename: Optional[str] = None,
+                                    lang: str = 'en',
+                                    slow: bool = False,
+                                    max_length: Optional[int] = None,
+                                    auto_play: bool = True,
+                                    play_only: bool = False) -> Optional[str]:
+        """
+        Async variant of process_pipeline.
+
+        The fetch runs on the shared aiohttp session so several pipelines can
+        overlap their network waits; see process_pipeline for the argument
+        descriptions.
+
+        Returns:
+            str: Path to the generated audio file or None if pipeline failed
+        """
+        data = await self.fetch_data_async(
+            api_url=api_url,
+            method=method,
+            headers=headers,
+            params=params,
+            json_data=json_data
+        )
+
+        if not data:
+            logger.error("No data fetched from API")
+            return None
+
+        # Extract text from data
+        text = self.extract_text(data, text_key, max_length)
+
+        if not text:
+            logger.error("No text extracted from data")
+            return None
+
+        logger.info(f"Extracted text: {text[:100]}..." if len(text) > 100 else f"Extracted text: {text}")
+
+        # Ephemeral playback: stream from memory and skip the disk
+        # round-trip, keeping the blocking synth + playback off the loop
+        if play_only and not output_filename:
+            await asyncio.to_thread(self.stream_speech, text, lang=lang, slow=slow)
+            return None
+
+        # Convert text to speech off the event loop
+        audio_file = await self.text_to_speech_async(
+            text=text,
+            filename=output_filename,
+            lang=lang,
+            slow=slow
+        )
+
+        if audio_file and _path_exists(audio_file) and auto_play:
+            # Playback blocks for the clip's full duration; keep it off the
+            # loop so concurrently gathered pipelines continue to overlap
+            await asyncio.to_thread(self.play_audio, audio_file)
+
         return audio_file
 
 
@@ -4,35 +4,93 @@ Gemini Text-to-Speech Integration Script
 Extends the Advanced TTS Integration to use Gemini API for text-to-speech conversion.
 """
 
+import asyncio
+import functools
+import itertools
 import os
+import re
 import logging
+import time
 import google.generativeai as genai
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Union, Any
 from advanced_tts_integration import AdvancedTTSIntegration
 
+# Transient Gemini failures worth retrying before degrading to plain gTTS;
+# google-api-core ships with the Gemini SDK, but guard the import anyway
+try:
+    from google.api_core import exceptions as _gapi_exceptions
+    TRANSIENT_GEMINI_ERRORS = (
+        _gapi_exceptions.ResourceExhausted,
+        _gapi_exceptions.ServiceUnavailable,
+        _gapi_exceptions.DeadlineExceeded,
+        _gapi_exceptions.InternalServerError,
+    )
+except ImportError:
+    TRANSIENT_GEMINI_ERRORS = ()
+
 # Configure logging
 logger = logging.getLogger("GeminiTTS")
 
+# Matches the whitespace after a sentence terminator, for carving complete
+# sentences out of a partially streamed Gemini response
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# Process-wide counter for generated fallback filenames; cheaper than a
+# stat() call and unique per invocation, unlike the module's mtime
+_filename_counter = itertools.count()
+
+# Resolved once at import (the base module has already run load_dotenv by
+# now), so constructors skip the per-instance environment lookup
+_GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model(model_name: str = 'gemini-1.5-pro') -> "genai.GenerativeModel":
+    """Return a shared GenerativeModel, constructed once per model name."""
+    return genai.GenerativeModel(model_name)
+
 class GeminiTTSIntegration(AdvancedTTSIntegration):
     """
     Extension of Advanced TTS Integration using Google's Gemini API for text-to-speech.
     """
-    
+
+    # Maximum concurrent synthesis calls in the async path, bounded to stay
+    # clear of Gemini/gTTS rate limits
+    MAX_TTS_CONCURRENCY = 4
+
+    # Compact rewrite instruction sent to Gemini; input tokens are billed
+    # and lengthen time-to-first-token, so the boilerplate stays short
+    _PROMPT_TMPL = ("Rewrite for natural speech, expand abbreviations and "
+                    "numbers, reply with only the text ({lang}): {text}")
+
+    # Longest text slice embedded in a prompt, guarding against
+    # pathological token counts
+    MAX_PROMPT_CHARS = 4000
+
+    # Maximum memoized Gemini rewrites kept per instance; identical
+    # (text, lang) pairs are served from memory instead of a repeat RPC
+    REWRITE_CACHE_MAX = 1024
+
     def __init__(self, 
                  api_url: Optional[str] = None, 
                  output_dir: str = "audio_output",
                  audio_format: str = "mp3",
                  api_headers: Optional[Dict[str, str]] = None,
-                 gemini_api_key: Optional[str] = None):
+                 gemini_api_key: Optional[str] = None,
+                 retries: int = 3,
+                 base_delay: float = 1.0):
         """
         Initialize the Gemini TTS Integration.
-        
+
         Args:
             api_url: URL to fetch text data from
             output_dir: Directory to save audio files
             audio_format: Output audio format (default: mp3)
             api_headers: Headers to use for API requests
             gemini_api_key: API key for Gemini API (if not provided, will be loaded from env var)
+            retries: Attempts per Gemini call before falling back to gTTS
+            base_delay: Backoff delay in seconds, doubled after each attempt
         """
         # Initialize the parent class
         super().__init__(
@@ -43,112 +101,358 @@ class GeminiTTSIntegration(AdvancedTTSIntegration):
             api_headers=api_headers
         )
         
+        # Retry policy for transient Gemini failures
+        self.retries = max(1, retries)
+        self.base_delay = base_delay
+
         # Set up Gemini API
-        self.gemini_api_key = gemini_api_key or os.getenv("GEMINI_API_KEY")
+        self.gemini_api_key = gemini_api_key or _GEMINI_API_KEY
         self.gemini_available = False
-        
+        self._model = None
+        # Set once the first real request succeeds; a bad key downgrades to
+        # Google TTS at that point instead of costing an RPC here
+        self._validated = False
+
+        # Semaphore guarding concurrent async synthesis, created lazily so
+        # it binds to the caller's event loop
+        self._tts_semaphore: Optional[asyncio.Semaphore] = None
+
+        # Finished rewrites keyed on (text, lang); insertion-ordered so the
+        # oldest entry is evicted once REWRITE_CACHE_MAX is reached
+        self._rewrite_cache: Dict[tuple, str] = {}
+
         if not self.gemini_api_key:
             logger.warning("No Gemini API key provided. Falling back to Google TTS.")
         else:
             try:
-                # Configure the Gemini API
+                # Configure the Gemini API and build the model once; the key
+                # is validated lazily by the first real request
                 genai.configure(api_key=self.gemini_api_key)
-                
-                # Test the API with a simple request to verify the key works
-                model = genai.GenerativeModel('gemini-1.5-pro')
-                test_response = model.generate_content("Test")
-                if test_response and hasattr(test_response, 'text'):
-                    self.gemini_available = True
-                    logger.info("Gemini API initialized and tested successfully")
-                else:
-                    logger.warning("Gemini API configuration succeeded but test request failed. Falling back to Google TTS.")
+                self._model = _get_model()
+                self.gemini_available = True
+                logger.info("Gemini API configured; key will be validated on first use")
             except Exception as e:
-                logger.error(f"Failed to initialize Gemini API: {e}")
+                logger.error("Failed to initialize Gemini API: %s", e)
                 logger.warning("Invalid or expired Gemini API key. Please update your .env file with a valid key.")
                 logger.warning("Falling back to Google TTS.")
-            
+
+
         # Update engines dictionary
         self.ENGINES["gemini"] = "Google Gemini API"
-        
-    def text_to_speech(self, 
-                      text: str, 
-                      filename: Optional[str] = None, 
+
+    def _build_prompt(self, text: str, lang: str) -> str:
+        """Fill the shared rewrite template, capping the embedded text length."""
+        return self._PROMPT_TMPL.format(lang=lang, text=text[:self.MAX_PROMPT_CHARS])
+
+    def _store_rewrite(self, key: tuple, rewritten: str) -> None:
+        """Memoize a finished Gemini rewrite, evicting the oldest past the cap."""
+        if len(self._rewrite_cache) >= self.REWRITE_CACHE_MAX:
+            self._rewrite_cache.pop(next(iter(self._rewrite_cache)))
+        self._rewrite_cache[key] = rewritten
+
+    def _generate_with_retry(self, prompt: str, stream: bool = False) -> Any:
+        """
+        Call generate_content, retrying transient failures with
+        exponential backoff before giving up.
+
+        Rate limits and 5xx responses are usually short-lived; retrying
+        keeps the higher-quality Gemini rewrite instead of degrading to
+        plain gTTS on the first hiccup.
+
+        Args:
+            prompt: Prompt to send to Gemini
+            stream: Request a streaming response
+
+        Returns:
+            The Gemini response (raises after the last failed attempt)
+        """
+        for attempt in range(self.retries):
+            try:
+                return self._model.generate_content(prompt, stream=stream)
+            except TRANSIENT_GEMINI_ERRORS as e:
+                if attempt == self.retries - 1:
+                    raise
+                delay = self.base_delay * (2 ** attempt)
+                logger.warning("Transient Gemini error (%s); retrying in %.1fs", e, delay)
+                time.sleep(delay)
+
+    async def _generate_with_retry_async(self, prompt: str) -> Any:
+        """Async counterpart of _generate_with_retry, sleeping on the loop."""
+        for attempt in range(self.retries):
+            try:
+                return await self._model.generate_content_async(prompt)
+            except TRANSIENT_GEMINI_ERRORS as e:
+                if attempt == self.retries - 1:
+                    raise
+                delay = self.base_delay * (2 ** attempt)
+                logger.warning("Transient Gemini error (%s); retrying in %.1fs", e, delay)
+                await asyncio.sleep(delay)
+
+
+    def text_to_speech(self,
+                      text: str,
+                      filename: Optional[str] = None,
                       lang: str = 'en',
-                      slow: bool = False) -> Optional[str]:
+                      slow: bool = False,
+                      use_gemini_preprocess: bool = False,
+                      in_memory: bool = False) -> Union[str, bytes, None]:
         """
-        Convert text to speech using the Gemini API.
-        
+        Convert text to speech, optionally normalizing it with Gemini first.
+
         Args:
             text: Text to convert to speech
             filename: Output filename (without extension)
             lang: Language code
             slow: Whether to speak slowly
-            
+            use_gemini_preprocess: Rewrite the text with Gemini for more
+                natural narration before synthesis (costs one extra RPC)
+            in_memory: Return the mp3 bytes instead of writing a file
+
         Returns:
             str: Path to the saved audio file or None if conversion failed
         """
         if not text:
             logger.warning("No text provided for conversion")
             return None
-        
-        # Check if Gemini API is available and working
+
+        # Plain synthesis goes straight to gTTS: the old code paid a Gemini
+        # round-trip here only to discard its output
+        if not use_gemini_preprocess:
+            return super().text_to_speech(text, filename, lang, slow,
+                                          in_memory=in_memory)
+
         if not self.gemini_api_key or not self.gemini_available:
             if not self.gemini_api_key:
-                logger.warning("Gemini API key not provided. Falling back to Google TTS.")
-            elif not self.gemini_available:
-                logger.warning("Gemini API not available (invalid key or API error). Falling back to Google TTS.")
-            
-            # Use the parent class implementation (gTTS)
-            return super().text_to_speech(text, filename, lang, slow)
-        
+                logger.warning("Gemini API key not provided. Synthesizing without preprocessing.")
+            else:
+                logger.warning("Gemini API not available (invalid key or API error). Synthesizing without preprocessing.")
+            return super().text_to_speech(text, filename, lang, slow,
+                                          in_memory=in_memory)
+
         # Generate filename if not provided
         if not filename:
-            filename = f"gemini_tts_{int(os.path.getmtime(__file__))}"
-        
-        # Add extension if not present
-        if not filename.endswith(f'.{self.audio_format}'):
-            filename += f'.{self.audio_format}'
-        
-        output_path = os.path.join(self.output_dir, filename)
-        
+            filename = f"gemini_tts_{next(_filename_counter)}_{time.time_ns()}"
+
+        # Identical (text, lang) pairs reuse the memoized rewrite instead
+        # of paying a repeat RPC
+        rewrite_key = (text, lang)
+        cached_rewrite = self._rewrite_cache.get(rewrite_key)
+        if cached_rewrite is not None:
+            logger.info("Reusing cached Gemini rewrite")
+            return super().text_to_speech(cached_rewrite, filename, lang, slow,
+                                          in_memory=in_memory)
+
         try:
-            logger.info(f"Using Gemini API to convert text to speech")
-            
-            # Configure the generation model (Gemini 1.5 Pro)
-            model = genai.GenerativeModel('gemini-1.5-pro')
-            
-            # Create prompt that instructs Gemini to describe how the TTS audio would sound
-            prompt = f"Convert the following text to a natural-sounding text-to-speech voice narration, optimizing for clarity and natural intonation. Use {lang} language: {text}"
-            
-            # Generate the audio description (this is a simulation since Gemini doesn't directly produce audio)
-            try:
-                response = model.generate_content(prompt)
-                
-                # Extract the generated text which simulates the audio
-                generated_text = response.text
-                
-                logger.info("Gemini API generated audio description successfully")
-                logger.info(f"Description: {generated_text[:100]}...")
-                
-                # Now use Google TTS to convert this to actual audio
-                return super().text_to_speech(text, filename, lang, slow)
-            except Exception as api_error:
-                logger.error(f"Error from Gemini API: {api_error}")
+            logger.info("Preprocessing text with Gemini before synthesis")
+
+            response = self._generate_with_retry(
+                self._build_prompt(text, lang), stream=True)
+
+            if self.audio_format == "mp3" and not in_memory:
+                # mp3 segments concatenate safely, so synthesize sentence by
+                # sentence while Gemini is still generating the rest; the
+                # in-memory mode buffers the full rewrite below instead
+                return self._synthesize_streamed(response, filename, lang, slow,
+                                                 rewrite_key=rewrite_key)
+
+            normalized_text = "".join(chunk.text for chunk in response)
+            self._validated = True
+            self._store_rewrite(rewrite_key, normalized_text)
+
+            logger.info("Gemini normalized text: %.100s...", normalized_text)
+
+            # Synthesize the normalized text instead of the raw input
+            return super().text_to_speech(normalized_text, filename, lang, slow,
+                                          in_memory=in_memory)
+
+        except Exception as api_error:
+            logger.error("Error from Gemini API: %s", api_error)
+            if not self._validated:
+                # First request never succeeded: the key is bad, so stop
+                # paying the failed RPC on every call
+                self.gemini_available = False
                 logger.info("The provided Gemini API key appears to be invalid. Falling back to Google TTS.")
-                return super().text_to_speech(text, filename, lang, slow)
-            
-        except Exception as e:
-            logger.error(f"Error using Gemini API: {e}")
-            logger.info("Falling back to Google TTS")
-            return super().text_to_speech(text, filename, lang, slow)
+            return super().text_to_speech(text, filename, lang, slow,
+                                          in_memory=in_memory)
+
+    def _synthesize_streamed(self,
+                             response: Any,
+                             filename: str,
+                             lang: str,
+                             slow: bool,
+                             rewrite_key: Optional[tuple] = None) -> Optional[str]:
+        """
+        Consume a streaming Gemini response, synthesizing each completed
+        sentence while later chunks are still being generated.
+
+        Sentences are dispatched to the parent synthesis on a small thread
+        pool as soon as their terminator arrives, and the resulting mp3
+        segments (gTTS mp3 output concatenates safely) are joined in order.
+        Time to first audio is therefore bounded by the first Gemini chunk
+        latency instead of the full completion latency.
+
+        Args:
+            response: Streaming response from generate_content(stream=True)
+            filename: Output filename (without extension)
+            lang: Language code
+            slow: Whether to speak slowly
+            rewrite_key: Cache key under which to memoize the full rewrite
+
+        Returns:
+            str: Path to the concatenated audio file or None if any
+                segment failed to synthesize
+        """
+        # Match the parent's extension normalization so a caller-supplied
+        # "name.mp3" does not come back as "name.mp3.mp3"
+        if filename.endswith(self._format_suffix):
+            filename = filename[:-len(self._format_suffix)]
+
+        synthesize = super().text_to_speech
+        futures: List[Any] = []
+        fragments: List[str] = []
+        buffer = ""
+
+        with ThreadPoolExecutor(max_workers=self.MAX_TTS_CONCURRENCY) as executor:
+            def dispatch(fragment: str) -> None:
+                fragment = fragment.strip()
+                if fragment:
+                    fragments.append(fragment)
+                    futures.append(executor.submit(
+                        synthesize, fragment,
+                        f"{filename}_seg{len(futures)}", lang, slow))
+
+            for chunk in response:
+                buffer += chunk.text
+                parts = _SENTENCE_END.split(buffer)
+                # Every element but the last ends in a sentence terminator
+                for sentence in parts[:-1]:
+                    dispatch(sentence)
+                buffer = parts[-1]
+            dispatch(buffer)
+
+        self._validated = True
+        if rewrite_key is not None and fragments:
+            self._store_rewrite(rewrite_key, " ".join(fragments))
+
+        segment_paths = [future.result() for future in futures]
+        if not segment_paths or not all(segment_paths):
+            logger.error("One or more streamed segments failed to synthesize")
+            return None
+
+        output_path = os.fspath(self.output_dir / (filename + self._format_suffix))
+        with open(output_path, "wb") as out:
+            for path in segment_paths:
+                with open(path, "rb") as segment:
+                    out.write(segment.read())
+
+        # Repeated sentences can alias several segments to one cached file;
+        # dedupe and tolerate already-removed paths so cleanup can never
+        # void the finished output
+        for path in dict.fromkeys(segment_paths):
+            if path == output_path:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        logger.info("Streamed synthesis saved as '%s'", output_path)
+        return output_path
+
+    async def text_to_speech_async(self,
+                                  text: str,
+                                  filename: Optional[str] = None,
+                                  lang: str = 'en',
+                                  slow: bool = False,
+                                  use_gemini_preprocess: bool = False,
+                                  in_memory: bool = False) -> Union[str, bytes, None]:
+        """
+        Async variant of text_to_speech for fanning out batches.
+
+        The Gemini rewrite (when requested) is awaited natively via
+        generate_content_async and the blocking gTTS synthesis runs in a
+        worker thread, so N concurrent calls cost roughly the slowest one.
+        A semaphore caps concurrency at MAX_TTS_CONCURRENCY.
+
+        Args:
+            text: Text to convert to speech
+            filename: Output filename (without extension)
+            lang: Language code
+            slow: Whether to speak slowly
+            use_gemini_preprocess: Rewrite the text with Gemini before synthesis
+            in_memory: Return the mp3 bytes instead of writing a file
+
+        Returns:
+            str: Path to the saved audio file (or the audio bytes when
+                in_memory is set), None if conversion failed
+        """
+        if not text:
+            logger.warning("No text provided for conversion")
+            return None
+
+        if self._tts_semaphore is None:
+            self._tts_semaphore = asyncio.Semaphore(self.MAX_TTS_CONCURRENCY)
+
+        async with self._tts_semaphore:
+            speech_text = text
+
+            if use_gemini_preprocess and self.gemini_api_key and self.gemini_available:
+                cached_rewrite = self._rewrite_cache.get((text, lang))
+                if cached_rewrite is not None:
+                    logger.info("Reusing cached Gemini rewrite")
+                    speech_text = cached_rewrite
+                else:
+                    try:
+                        logger.info("Preprocessing text with Gemini before synthesis")
+                        response = await self._generate_with_retry_async(
+                            self._build_prompt(text, lang))
+                        speech_text = response.text
+                        self._validated = True
+                        self._store_rewrite((text, lang), speech_text)
+                    except Exception as api_error:
+                        logger.error("Error from Gemini API: %s", api_error)
+                        if not self._validated:
+                            self.gemini_available = False
+                            logger.info("The provided Gemini API key appears to be invalid. Falling back to Google TTS.")
+
+            # gTTS is blocking; keep it off the event loop
+            return await asyncio.to_thread(
+                super().text_to_speech, speech_text, filename, lang, slow,
+                in_memory
+            )
+
+    async def batch_synthesize(self,
+                              texts: List[str],
+                              lang: str = 'en',
+                              slow: bool = False,
+                              use_gemini_preprocess: bool = False) -> List[Any]:
+        """
+        Synthesize several texts concurrently.
+
+        Args:
+            texts: Texts to convert to speech
+            lang: Language code
+            slow: Whether to speak slowly
+            use_gemini_preprocess: Rewrite each text with Gemini before synthesis
+
+        Returns:
+            list: Audio file paths (or exceptions) in input order
+        """
+        return await asyncio.gather(
+            *[self.text_to_speech_async(text, lang=lang, slow=slow,
+                                        use_gemini_preprocess=use_gemini_preprocess)
+              for text in texts],
+            return_exceptions=True
+        )
 
 
 # Example usage
 if __name__ == "__main__":
     from dotenv import load_dotenv
-    
-    # Load environment variables
-    load_dotenv()
+
+    # Load environment variables unless the key is already present
+    if not _GEMINI_API_KEY:
+        load_dotenv()
     
     # Create Gemini TTS integration instance
     tts = GeminiTTSIntegration(output_dir="gemini_audio")
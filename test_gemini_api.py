@@ -3,17 +3,35 @@
 A simple test script to verify if the Gemini API key is valid.
 """
 
+import importlib
 import os
 import sys
+import threading
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Warm the google.generativeai import on a background thread so its cold
+# module load overlaps the dotenv parsing and key checks below
+def _warm_genai_import():
+    try:
+        importlib.import_module("google.generativeai")
+    except ImportError:
+        # Swallow it here: main()'s own import retries and reports the
+        # missing package cleanly instead of a raw thread traceback
+        pass
+
+_genai_import = threading.Thread(target=_warm_genai_import, daemon=True)
+_genai_import.start()
+
+# Load environment variables, skipping the .env read and parse when the
+# key is already in the environment; resolve it once for the whole run
+if not os.environ.get("GEMINI_API_KEY"):
+    load_dotenv()
+_GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
 
 def main():
     """Check if the Gemini API key is valid and usable."""
-    gemini_api_key = os.getenv("GEMINI_API_KEY")
-    
+    gemini_api_key = _GEMINI_API_KEY
+
     if not gemini_api_key:
         print("Error: GEMINI_API_KEY environment variable not found.")
         print("Please add your Gemini API key to the .env file.")
@@ -21,18 +39,29 @@ def main():
     
     print(f"Found Gemini API key: {gemini_api_key[:10]}...")
     
-    # Try to import and configure Google GenerativeAI
+    # Try to import and configure Google GenerativeAI; the background
+    # import started at module load has usually finished by now
+    _genai_import.join()
     try:
         import google.generativeai as genai
         genai.configure(api_key=gemini_api_key)
         
-        # Try a simple API call to verify the key
-        print("Testing API key with a simple request...")
-        model = genai.GenerativeModel('gemini-1.5-pro')
-        response = model.generate_content("Hello, World!")
-        
-        print("API test successful! Response:")
-        print(response.text)
+        # Verify the key with the lightweight list_models call: one HTTP
+        # round trip, no generation latency and no token/quota cost
+        print("Testing API key by listing available models...")
+        model_names = []
+        for model in genai.list_models():
+            model_names.append(model.name)
+            if len(model_names) >= 5:
+                break
+
+        if not model_names:
+            print("Error: API key accepted but no models are available.")
+            return False
+
+        print("API test successful! Available models include:")
+        for name in model_names:
+            print(f"- {name}")
         return True
         
     except ImportError: